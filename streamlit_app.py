@@ -0,0 +1,3 @@
+from subnetter.ui.render import render
+
+render("wide")
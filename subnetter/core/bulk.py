@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, List
+
+import numpy as np
+
+# enumerate_hosts refuses larger blocks unless asked: a /8 is 64 MiB of uint32,
+# a /0 would be 16 GiB.
+DEFAULT_MAX_HOSTS = 1 << 24
+
+
+def _kernel_np(ips, prefixes, out_net, out_bcast, out_mask, out_first, out_last, out_total, out_usable):
+    host_bits = 32 - prefixes.astype(np.int64)
+    total = np.int64(1) << host_bits
+    # 1 for /0-/30, 0 for /31 and /32: trims first/last host and usable count.
+    add_one = (prefixes < 31).astype(np.int64)
+    out_mask[:] = (np.int64(0xFFFFFFFF) << host_bits) & 0xFFFFFFFF
+    out_net[:] = ips & out_mask
+    out_bcast[:] = out_net | (total - 1)
+    out_first[:] = out_net + add_one
+    out_last[:] = out_bcast - add_one
+    out_total[:] = total
+    out_usable[:] = total - 2 * add_one
+
+
+@lru_cache(maxsize=None)
+def _get_kernel():
+    # numba is optional and imported here on first use, so importing this
+    # module never pays for the numba import or JIT compilation.
+    try:
+        import numba as nb
+    except ImportError:
+        return _kernel_np
+
+    u32 = nb.uint32[::1]
+    u64 = nb.uint64[::1]
+    signature = nb.void(u32, nb.uint8[::1], u32, u32, u32, u32, u32, u64, u64)
+
+    @nb.njit(signature, cache=True, parallel=True)
+    def kernel_loop(ips, prefixes, out_net, out_bcast, out_mask, out_first, out_last, out_total, out_usable):
+        for i in nb.prange(len(ips)):
+            host_bits = 32 - np.int64(prefixes[i])
+            total = np.int64(1) << host_bits
+            add_one = np.int64(prefixes[i] < 31)
+            mask = (np.int64(0xFFFFFFFF) << host_bits) & 0xFFFFFFFF
+            net = np.int64(ips[i]) & mask
+            bcast = net | (total - 1)
+            out_mask[i] = mask
+            out_net[i] = net
+            out_bcast[i] = bcast
+            out_first[i] = net + add_one
+            out_last[i] = bcast - add_one
+            out_total[i] = total
+            out_usable[i] = total - 2 * add_one
+
+    return kernel_loop
+
+
+def compute_subnets_bulk(ip_ints: np.ndarray, prefixes: np.ndarray) -> Dict[str, np.ndarray]:
+    ip_arr = np.asarray(ip_ints)
+    pfx_arr = np.asarray(prefixes)
+    if ip_arr.ndim != 1 or ip_arr.shape != pfx_arr.shape:
+        raise ValueError("ip_ints and prefixes must be 1-D arrays of the same length.")
+    if ip_arr.size:
+        # Validate before casting: uint32/uint8 casts wrap out-of-range values silently.
+        if ip_arr.dtype.kind not in "iu" or pfx_arr.dtype.kind not in "iu":
+            raise ValueError("ip_ints and prefixes must be integer arrays.")
+        if ip_arr.min() < 0 or ip_arr.max() > 0xFFFFFFFF:
+            raise ValueError("IP address must be a 32-bit IPv4 value.")
+        if pfx_arr.min() < 0 or pfx_arr.max() > 32:
+            raise ValueError("CIDR must be between /0 and /32.")
+
+    ips = np.ascontiguousarray(ip_arr, dtype=np.uint32)
+    pfx = np.ascontiguousarray(pfx_arr, dtype=np.uint8)
+
+    network, broadcast, netmask, first_host, last_host = (np.empty_like(ips) for _ in range(5))
+    total_hosts = np.empty(ips.shape, dtype=np.uint64)
+    usable_hosts = np.empty(ips.shape, dtype=np.uint64)
+    _get_kernel()(ips, pfx, network, broadcast, netmask, first_host, last_host, total_hosts, usable_hosts)
+    return {
+        "network": network,
+        "broadcast": broadcast,
+        "netmask": netmask,
+        "wildcard": ~netmask,
+        "first_host": first_host,
+        "last_host": last_host,
+        "total_hosts": total_hosts,
+        "usable_hosts": usable_hosts,
+    }
+
+
+def enumerate_hosts(network_int: int, prefix: int, max_hosts: int = DEFAULT_MAX_HOSTS) -> np.ndarray:
+    if not (0 <= network_int <= 0xFFFFFFFF):
+        raise ValueError("IP address must be a 32-bit IPv4 value.")
+    if not (0 <= prefix <= 32):
+        raise ValueError("CIDR must be between /0 and /32.")
+    total = 1 << (32 - prefix)
+    count = total - 2 if prefix < 31 else total
+    if count > max_hosts:
+        raise ValueError(f"/{prefix} has {count} hosts, more than max_hosts={max_hosts}.")
+    base = network_int & ~(total - 1)
+    hosts = np.arange(base, base + total, dtype=np.uint32)
+    # Slice off the network and broadcast entries where _USABLE excludes them.
+    return hosts[1:-1] if prefix < 31 else hosts
+
+
+def to_dotted(ip_ints: np.ndarray) -> List[str]:
+    arr = np.asarray(ip_ints)
+    if arr.size:
+        # The >u4 cast below would wrap out-of-range values silently.
+        if arr.dtype.kind not in "iu":
+            raise ValueError("ip_ints must be an integer array.")
+        if arr.min() < 0 or arr.max() > 0xFFFFFFFF:
+            raise ValueError("IP address must be a 32-bit IPv4 value.")
+    # Big-endian uint32 bytes are the four octets in display order.
+    octets = np.ascontiguousarray(arr, dtype=">u4").view(np.uint8).reshape(-1, 4)
+    return ["{}.{}.{}.{}".format(*row) for row in octets.tolist()]
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import ipaddress
+import socket
+import struct
+import sys
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 
 
-@dataclass(frozen=True)
+# slots=True drops the per-instance __dict__; only available on Python 3.10+.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SubnetInfo:
     ip: str
     cidr: int
@@ -20,64 +28,182 @@ class SubnetInfo:
     host_bits: int
 
 
-def parse_ip_and_mask(ip_input: str, mask_input: Optional[str] = None) -> Tuple[ipaddress.IPv4Address, int]:
-    ip_input = ip_input.strip()
-    if "/" in ip_input and mask_input is None:
-        iface = ipaddress.ip_interface(ip_input)
-        if not isinstance(iface.ip, ipaddress.IPv4Address):
-            raise ValueError("IPv6 is not supported in this tool.")
-        return iface.ip, int(iface.network.prefixlen)
+MAX_USABLE_HOSTS = (1 << 32) - 2
+
+CACHE_SIZE = 4096
+
+if sys.version_info >= (3, 10):
+    _popcount = int.bit_count
+else:
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
+_pack_u32 = struct.Struct("!I").pack
+_unpack_u32 = struct.Struct("!I").unpack
+
+
+def _parse_ipv4(s: str) -> int:
+    # inet_pton parses strict dotted-quad in C; the Python parser below only
+    # runs for input it rejects, to raise a readable error.
+    try:
+        return _unpack_u32(socket.inet_pton(socket.AF_INET, s))[0]
+    except (OSError, ValueError):
+        return _parse_ipv4_py(s)
+
+
+def _parse_ipv4_py(s: str) -> int:
+    parts = s.split(".")
+    if len(parts) != 4 or not all(
+        p.isascii() and p.isdigit() and len(p) <= 3 and (p == "0" or p[0] != "0") for p in parts
+    ):
+        raise ValueError(f"{s!r} is not a valid IPv4 address.")
+    a, b, c, d = map(int, parts)
+    if a > 255 or b > 255 or c > 255 or d > 255:
+        raise ValueError(f"{s!r} is not a valid IPv4 address.")
+    return (a << 24) | (b << 16) | (c << 8) | d
+
+
+def _int_to_dotted(x: int) -> str:
+    return socket.inet_ntoa(_pack_u32(x))
+
+
+# Per-prefix lookup tables for /0 through /32.
+_MASKS = tuple((0xFFFFFFFF << (32 - p)) & 0xFFFFFFFF for p in range(33))
+_MASK_STRS = tuple(sys.intern(_int_to_dotted(m)) for m in _MASKS)
+_WILDCARD_STRS = tuple(sys.intern(_int_to_dotted(m ^ 0xFFFFFFFF)) for m in _MASKS)
+_TOTALS = tuple(1 << (32 - p) for p in range(33))
+# /31 and /32 have no separate network/broadcast to exclude (RFC 3021).
+_USABLE = tuple(t - 2 for t in _TOTALS[:31]) + (2, 1)
+
+
+def _prefix_from_mask(mask: str) -> int:
+    if mask.isascii() and mask.isdigit():
+        prefix = int(mask)
+        if not (0 <= prefix <= 32):
+            raise ValueError("CIDR must be between /0 and /32.")
+        return prefix
+
+    try:
+        mask_int = _parse_ipv4(mask)
+    except ValueError:
+        raise ValueError(f"{mask!r} is not a valid subnet mask or /CIDR.") from None
+    ones = _popcount(mask_int)
+    inverse = mask_int ^ 0xFFFFFFFF
+    if inverse & (inverse + 1) == 0:
+        return ones
+    # Hostmask (wildcard) form, e.g. 0.0.0.255
+    if mask_int & (mask_int + 1) == 0:
+        return 32 - ones
+    raise ValueError(f"{mask!r} is not a valid netmask.")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_ip_and_mask(ip_input: str, mask_input: Optional[str] = None) -> Tuple[int, int]:
+    head, slash, tail = ip_input.strip().partition("/")
+    if ":" in head:
+        raise ValueError("IPv6 is not supported in this tool.")
+
+    # An IP/CIDR carries its own prefix and takes precedence over mask_input.
+    if slash:
+        return _parse_ipv4(head), _prefix_from_mask(tail)
 
     if mask_input is None:
         raise ValueError("Missing subnet mask. Provide dotted mask or use IP/CIDR.")
 
-    ip = ipaddress.IPv4Address(ip_input)
+    ip = _parse_ipv4(head)
     mask_raw = mask_input.strip()
     if mask_raw.startswith("/"):
-        prefix = int(mask_raw[1:])
-        if not (0 <= prefix <= 32):
-            raise ValueError("CIDR must be between /0 and /32.")
-        return ip, prefix
-
-    dummy = ipaddress.ip_network(f"0.0.0.0/{mask_raw}", strict=False)
-    return ip, int(dummy.prefixlen)
+        mask_raw = mask_raw[1:].strip()
+    return ip, _prefix_from_mask(mask_raw)
 
 
-def wildcard_from_netmask(mask: ipaddress.IPv4Address) -> ipaddress.IPv4Address:
+def wildcard_from_netmask(mask: Union[int, ipaddress.IPv4Address]) -> ipaddress.IPv4Address:
+    # Public helper only; compute_subnet reads wildcards from _WILDCARD_STRS.
     return ipaddress.IPv4Address(int(mask) ^ 0xFFFFFFFF)
 
 
-def compute_subnet(ip: ipaddress.IPv4Address, prefix: int) -> SubnetInfo:
-    net = ipaddress.IPv4Network((ip, prefix), strict=False)
-    network = net.network_address
-    broadcast = net.broadcast_address
-    mask = net.netmask
-    wildcard = wildcard_from_netmask(mask)
-    host_bits = 32 - prefix
-    total = 1 << host_bits
+def compute_subnet(ip: Union[int, ipaddress.IPv4Address], prefix: int) -> SubnetInfo:
+    return _compute_subnet_int(int(ip), prefix)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compute_subnet_int(ip_int: int, prefix: int) -> SubnetInfo:
+    if not (0 <= ip_int <= 0xFFFFFFFF):
+        raise ValueError("IP address must be a 32-bit IPv4 value.")
+    if not (0 <= prefix <= 32):
+        raise ValueError("CIDR must be between /0 and /32.")
 
     if prefix == 32:
-        usable = 1
-        first_host = last_host = ip
-    elif prefix == 31:
-        usable = 2
-        first_host = network
-        last_host = broadcast
-    else:
-        usable = max(total - 2, 0)
-        first_host = network + 1 if total >= 4 else network
-        last_host = broadcast - 1 if total >= 4 else broadcast
+        return _build_host_info(ip_int)
+    if prefix == 31:
+        return _build_p2p_info(ip_int)
+
+    total = _TOTALS[prefix]
+    net_int = ip_int & _MASKS[prefix]
+    bcast_int = net_int | (total - 1)
 
     return SubnetInfo(
-        ip=str(ip),
+        ip=_int_to_dotted(ip_int),
         cidr=prefix,
-        network=str(network),
-        broadcast=str(broadcast),
-        netmask=str(mask),
-        wildcard=str(wildcard),
-        first_host=str(first_host),
-        last_host=str(last_host),
+        network=_int_to_dotted(net_int),
+        broadcast=_int_to_dotted(bcast_int),
+        netmask=_MASK_STRS[prefix],
+        wildcard=_WILDCARD_STRS[prefix],
+        first_host=_int_to_dotted(net_int + 1),
+        last_host=_int_to_dotted(bcast_int - 1),
         total_hosts=total,
-        usable_hosts=usable,
-        host_bits=host_bits,
-    )
\ No newline at end of file
+        usable_hosts=_USABLE[prefix],
+        host_bits=32 - prefix,
+    )
+
+
+def _build_host_info(ip_int: int) -> SubnetInfo:
+    # /32: every address field is the host itself.
+    ip = _int_to_dotted(ip_int)
+    return SubnetInfo(
+        ip=ip,
+        cidr=32,
+        network=ip,
+        broadcast=ip,
+        netmask=_MASK_STRS[32],
+        wildcard=_WILDCARD_STRS[32],
+        first_host=ip,
+        last_host=ip,
+        total_hosts=1,
+        usable_hosts=1,
+        host_bits=0,
+    )
+
+
+def _build_p2p_info(ip_int: int) -> SubnetInfo:
+    # /31 point-to-point link: the pair is both network and host range.
+    low_int = ip_int & 0xFFFFFFFE
+    low = _int_to_dotted(low_int)
+    high = _int_to_dotted(low_int | 1)
+    return SubnetInfo(
+        ip=low if ip_int == low_int else high,
+        cidr=31,
+        network=low,
+        broadcast=high,
+        netmask=_MASK_STRS[31],
+        wildcard=_WILDCARD_STRS[31],
+        first_host=low,
+        last_host=high,
+        total_hosts=2,
+        usable_hosts=2,
+        host_bits=1,
+    )
+
+
+def subnet_for_hosts(hosts: int) -> Tuple[int, int, int]:
+    if not (1 <= hosts <= MAX_USABLE_HOSTS):
+        raise ValueError(f"Host count must be between 1 and {MAX_USABLE_HOSTS}.")
+    if hosts <= 2:
+        # A single host fits a /32; two fit a /31 point-to-point link.
+        return 33 - hosts, hosts, hosts
+
+    # Smallest block with total - 2 >= hosts, i.e. total >= hosts + 2.
+    host_bits = (hosts + 1).bit_length()
+    total = 1 << host_bits
+    return 32 - host_bits, total, total - 2
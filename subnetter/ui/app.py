@@ -1,394 +1,12 @@
+import os
 import sys
-from pathlib import Path
-import io
-from dataclasses import asdict
 
-import streamlit as st
-import pandas as pd
+# Running this file directly (streamlit run subnetter/ui/app.py) only puts
+# subnetter/ui on sys.path; add the project root once so the package imports.
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from subnetter.ui.render import render
 
-from subnetter.core.calculator import parse_ip_and_mask, compute_subnet
-
-st.set_page_config(page_title="Subnetter", page_icon="🌐", layout="wide")
-
-# Header
-st.title("🌐 Subnetter")
-st.caption("IPv4 Subnet Calculator")
-
-# Tabs for organization
-tab1, tab2, tab3, tab4 = st.tabs(["Calculator", "Reference", "Notes", "Planner"])
-
-with tab1:
-    # Input section
-    st.subheader("Enter Network Details")
-    
-    col1, col2 = st.columns([2, 1])
-    with col1:
-        ip_in = st.text_input(
-            "IP Address",
-            placeholder="192.168.1.10 or 192.168.1.10/24",
-            help="Enter an IP address with or without CIDR notation"
-        )
-    
-    show_mask = "/" not in ip_in if ip_in else True
-    mask_in = None
-    
-    with col2:
-        if show_mask:
-            mask_in = st.text_input(
-                "Subnet Mask",
-                placeholder="255.255.255.0 or /24",
-                help="Enter dotted notation or /CIDR format"
-            )
-    
-    # Calculate button
-    if st.button("Calculate", type="primary", use_container_width=True):
-        try:
-            if ip_in.strip() == "":
-                st.error("Please enter an IP address.")
-            else:
-                ip, prefix = parse_ip_and_mask(ip_in, mask_in if show_mask and mask_in else None)
-                info = compute_subnet(ip, prefix)
-                
-                # Success indicator
-                st.success("✓ Subnet calculated successfully")
-                
-                # Results in tabs
-                result_col1, result_col2, result_col3 = st.columns(3)
-                
-                with result_col1:
-                    st.subheader("Network Info")
-                    st.metric("Network Address", info.network)
-                    st.metric("Broadcast Address", info.broadcast)
-                    st.metric("Subnet Mask", info.netmask)
-                    st.metric("Wildcard Mask", info.wildcard)
-                
-                with result_col2:
-                    st.subheader("Host Info")
-                    st.metric("First Host", info.first_host)
-                    st.metric("Last Host", info.last_host)
-                    st.metric("Total Addresses", info.total_hosts)
-                    st.metric("Usable Hosts", info.usable_hosts)
-                
-                with result_col3:
-                    st.subheader("Additional Info")
-                    st.metric("Your IP", info.ip)
-                    st.metric("CIDR Notation", f"/{info.cidr}")
-                    st.metric("Host Bits", info.host_bits)
-                
-                # Special note for /31
-                if info.cidr == 31:
-                    st.info("📌 **/31 Point-to-Point**: Both addresses are usable")
-                
-                # Results table
-                st.divider()
-                st.subheader("Full Results Table")
-                
-                data_dict = asdict(info)
-                results_df = pd.DataFrame(
-                    list(data_dict.items()),
-                    columns=["Field", "Value"]
-                )
-                st.dataframe(
-                    results_df, 
-                    use_container_width=True, 
-                    hide_index=True,
-                    height=423
-                )
-                
-                # Download CSV
-                csv = io.StringIO()
-                csv.write("field,value\n")
-                for k, v in data_dict.items():
-                    csv.write(f"{k},{v}\n")
-                
-                st.download_button(
-                    label="📥 Download as CSV",
-                    data=csv.getvalue(),
-                    file_name="subnet_result.csv",
-                    mime="text/csv",
-                    use_container_width=True
-                )
-        
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
-
-with tab2:
-    st.subheader("Common Subnet Masks")
-    
-    common_masks = {
-        "/8": "255.0.0.0",
-        "/12": "255.240.0.0",
-        "/16": "255.255.0.0",
-        "/24": "255.255.255.0",
-        "/25": "255.255.255.128",
-        "/26": "255.255.255.192",
-        "/27": "255.255.255.224",
-        "/28": "255.255.255.240",
-        "/29": "255.255.255.248",
-        "/30": "255.255.255.252",
-        "/31": "255.255.255.254 (Point-to-Point)",
-        "/32": "255.255.255.255 (Single Host)",
-    }
-    
-    mask_text = "\n".join([f"{cidr:5} → {mask}" for cidr, mask in common_masks.items()])
-    st.code(mask_text, language=None)
-    
-    st.divider()
-    st.subheader("Quick Tips")
-    st.markdown("""
-    - **Usable hosts** = Total addresses - 2 (network & broadcast)
-    - **/32 networks** are single hosts
-    - Use **/24** for most LANs (~250 hosts)
-    - Use **/31** for router links (point-to-point)
-    """)
-
-with tab3:
-    st.header("Subnetting Fundamentals")
-    
-    st.markdown("""
-    ### Key Concepts
-    
-    **CIDR Notation:** `/24` represents the number of bits in the subnet mask
-    - Example: `192.168.1.0/24` means the first 24 bits identify the network
-    
-    **Subnet Bits vs Host Bits:**
-    - Total bits in IPv4: 32
-    - Subnet bits: determined by CIDR prefix
-    - Host bits: 32 - CIDR prefix
-    - Example: `/24` = 24 subnet bits, 8 host bits
-    
-    ---
-                            
-    ### Subnetting Calculation Steps
-    
-    1. **Identify subnet prefix** — How many bits for the network?
-    2. **Calculate host bits** — 32 - prefix length
-    3. **Determine subnet size** — 2^(host bits)
-    4. **Calculate number of subnets** — How many can you create?
-    5. **List all subnets** — Find start and end addresses
-    
-    ### Binary Representation of Subnet Masks
-                
-    | Prefix | Binary Netmask | Decimal Netmask | # of Subnets | # of Hosts | 128 | 64 | 32 | 16 | 8 | 4 | 2 | 1 |
-    |--------|---|---|---|---|---|---|---|---|---|---|---|---|
-    | /25 | .1000 0000 | .128 | 2 = 2^1 | 126 = 2^7 - 2 | 1 | 0 | 0 | 0 | 0 | 0 | 0 | 0 |
-    | /26 | .1100 0000 | .192 | 4 = 2^2 | 62 = 2^6 - 2 | 1 | 1 | 0 | 0 | 0 | 0 | 0 | 0 |
-    | /27 | .1110 0000 | .224 | 8 = 2^3 | 30 = 2^5 - 2 | 1 | 1 | 1 | 0 | 0 | 0 | 0 | 0 |
-    | /28 | .1111 0000 | .240 | 16 = 2^4 | 14 = 2^4 - 2 | 1 | 1 | 1 | 1 | 0 | 0 | 0 | 0 |
-    | /29 | .1111 1000 | .248 | 32 = 2^5 | 6 = 2^3 - 2 | 1 | 1 | 1 | 1 | 1 | 0 | 0 | 0 |
-    | /30 | .1111 1100 | .252 | 64 = 2^6 | 2 = 2^2 - 2 | 1 | 1 | 1 | 1 | 1 | 1 | 0 | 0 |
-                      
-    ### Example Calculation
-    
-    IP address `192.168.200.139` with subnet mask `/27`
-    
-    - Host bits: 32 - 27 = 5
-    - Total addresses: 2^5 = 32
-    - Usable hosts: 32 - 2 = 30
-    - Network address: 192.168.200.128
-    - Broadcast address: 192.168.200.159
-    - First host: 192.168.200.129
-    - Last host: 192.168.200.158            
-
-    ---   
-
-    ### Common Private IP Ranges (Classful)
-    
-    | Class | Range | CIDR |
-    |-------|-------|------|
-    | A | 10.0.0.0 — 10.255.255.255 | /8 |
-    | B | 172.16.0.0 — 172.31.255.255 | /12 |
-    | C | 192.168.0.0 — 192.168.255.255 | /16 |
-    
-    ---
-
-    ### Subnet Mask Reference
-    
-    | Prefix | Dotted Notation | Host Bits | Total Addresses | Usable Hosts |
-    |--------|-----------------|-----------|-----------------|--------------|
-    | /8 | 255.0.0.0 | 24 | 16,777,216 | 16,777,214 |
-    | /12 | 255.240.0.0 | 20 | 1,048,576 | 1,048,574 |
-    | /16 | 255.255.0.0 | 16 | 65,536 | 65,534 |
-    | /20 | 255.255.240.0 | 12 | 4,096 | 4,094 |
-    | /24 | 255.255.255.0 | 8 | 256 | 254 |
-    | /25 | 255.255.255.128 | 7 | 128 | 126 |
-    | /26 | 255.255.255.192 | 6 | 64 | 62 |
-    | /27 | 255.255.255.224 | 5 | 32 | 30 |
-    | /28 | 255.255.255.240 | 4 | 16 | 14 |
-    | /29 | 255.255.255.248 | 3 | 8 | 6 |
-    | /30 | 255.255.255.252 | 2 | 4 | 2 |
-    | /31 | 255.255.255.254 | 1 | 2 | 2 |
-    | /32 | 255.255.255.255 | 0 | 1 | 1 |
-    
-    ---
-
-    ### Special Cases
-    
-    - **/31 (Point-to-Point):** Both addresses are usable (RFC 3021) — used for router links
-    - **/32 (Host):** Single IP address, typically used for loopback
-    - **/0 (Any):** Matches all IPv4 addresses
-    """)
-
-with tab4:
-    st.subheader("Subnet Planner")
-    st.caption("Plan subnets based on host requirements")
-    
-    # Parent network input
-    parent_net = st.text_input(
-        "Parent Network",
-        value="192.168.1.0/24",
-        placeholder="192.168.1.0/24",
-        help="Enter the network IP in CIDR notation"
-    )
-    
-    # Parse parent network
-    parent_prefix = parent_host_bits = parent_total_addrs = 0
-    parent_valid = False
-
-    try:
-        parent_parts = parent_net.strip().split("/")
-        if len(parent_parts) != 2:
-            raise ValueError("Invalid format - use CIDR notation")
-        parent_prefix = int(parent_parts[1])
-        if not (0 <= parent_prefix <= 32):
-            raise ValueError("CIDR must be 0-32")
-        parent_host_bits = 32 - parent_prefix
-        parent_total_addrs = 1 << parent_host_bits
-        parent_valid = True
-    except ValueError as e:
-        st.error(f"❌ {str(e)}")
-    
-    if parent_valid:
-        st.info(f"📊 Available: **{parent_total_addrs}** addresses ({parent_prefix} → {parent_host_bits} host bits)")
-    
-    st.divider()
-    st.subheader("Requirements")
-    
-    # Initialize session state
-    if "requirements" not in st.session_state:
-        st.session_state.requirements = [
-            {"name": "Subnet A", "hosts": 58},
-            {"name": "Subnet B", "hosts": 28},
-            {"name": "Subnet C", "hosts": 12},
-        ]
-    
-    if st.button("➕ Add Requirement", use_container_width=True):
-        new_idx = len(st.session_state.requirements)
-        st.session_state.requirements.append(
-            {"name": f"Subnet {chr(65 + new_idx)}", "hosts": 0}
-        )
-        st.rerun()
-    
-    # Column headers
-    col1, col2, spacer, col3, col4, col5 = st.columns([1.3, 0.8, 0.1, 0.5, 0.5, 0.4])
-    with col1:
-        st.caption("Subnet Name")
-    with col2:
-        st.caption("Hosts Needed")
-    with col3:
-        st.caption("CIDR")
-    with col4:
-        st.caption("Total Addresses")
-    
-    # Display requirements
-    total_addrs_needed = 0
-    requirement_data = []
-    
-    for idx, req in enumerate(st.session_state.requirements):
-        col1, col2, spacer, col3, col4, col5 = st.columns([1.3, 0.8, 0.1, 0.5, 0.5, 0.4])
-        
-        with col1:
-            st.session_state.requirements[idx]["name"] = st.text_input(
-                "Name",
-                value=req["name"],
-                key=f"name_{idx}",
-                label_visibility="collapsed"
-            )
-        
-        with col2:
-            st.session_state.requirements[idx]["hosts"] = st.number_input(
-                "Hosts",
-                value=req["hosts"],
-                min_value=0,
-                key=f"hosts_{idx}",
-                label_visibility="collapsed"
-            )
-        
-        # Calculate subnet size
-        hosts = st.session_state.requirements[idx]["hosts"]
-        prefix = total_addrs = usable = 0
-        
-        if hosts == 0:
-            pass
-        elif hosts == 1:
-            prefix, total_addrs, usable = 32, 1, 1
-        elif hosts == 2:
-            prefix, total_addrs, usable = 31, 2, 2
-        else:
-            host_bits = 1
-            while (1 << host_bits) - 2 < hosts:
-                host_bits += 1
-            prefix = 32 - host_bits
-            total_addrs = 1 << host_bits
-            usable = total_addrs - 2
-        
-        if total_addrs > 0:
-            total_addrs_needed += total_addrs
-            requirement_data.append({
-                "name": st.session_state.requirements[idx]["name"],
-                "hosts": hosts,
-                "prefix": prefix,
-                "total_addrs": total_addrs,
-                "usable": usable
-            })
-
-        with spacer:
-            st.empty()
-
-        with col3:
-            st.metric("", f"/{prefix}" if prefix else "—", label_visibility="collapsed")
-        
-        with col4:
-            st.metric("", total_addrs if total_addrs else "—", label_visibility="collapsed")
-        
-        with col5:
-            if st.button("🗑️", key=f"del_{idx}", use_container_width=True):
-                st.session_state.requirements.pop(idx)
-                st.rerun()
-    
-    st.divider()
-    
-    # Validation and results
-    if parent_valid:
-        is_valid = total_addrs_needed > 0 and total_addrs_needed <= parent_total_addrs
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total Needed", total_addrs_needed)
-        with col2:
-            st.metric("Available", parent_total_addrs)
-        
-        if is_valid:
-            st.success(f"✓ Valid! ({total_addrs_needed}/{parent_total_addrs} used)")
-        else:
-            st.error(f"✗ Insufficient ({total_addrs_needed} needed, {parent_total_addrs} available)")
-        
-        # Display results
-        if requirement_data:
-            st.subheader("Subnet Plan")
-            results_df = pd.DataFrame(requirement_data)
-            st.dataframe(
-                results_df,
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "name": st.column_config.TextColumn("Subnet"),
-                    "hosts": st.column_config.NumberColumn("Hosts Needed"),
-                    "prefix": st.column_config.NumberColumn("CIDR Prefix"),
-                    "total_addrs": st.column_config.NumberColumn("Total Addresses"),
-                    "usable": st.column_config.NumberColumn("Usable Hosts"),
-                }
-            )
+render("wide")
@@ -0,0 +1,120 @@
+import ipaddress
+
+import numpy as np
+import pytest
+
+from subnetter.core.bulk import _get_kernel, _kernel_np, compute_subnets_bulk, enumerate_hosts, to_dotted
+from subnetter.core.calculator import compute_subnet
+
+
+def _dotted(x):
+    return str(ipaddress.IPv4Address(int(x)))
+
+
+class TestComputeSubnetsBulk:
+    ips = np.array(
+        [int(ipaddress.IPv4Address(a)) for a in ("192.168.200.139", "10.1.2.3", "172.16.0.1", "8.8.8.8")],
+        dtype=np.uint32,
+    )
+    prefixes = np.array([27, 0, 31, 32], dtype=np.uint8)
+
+    def test_matches_compute_subnet(self):
+        out = compute_subnets_bulk(self.ips, self.prefixes)
+        for i, (ip, prefix) in enumerate(zip(self.ips, self.prefixes)):
+            info = compute_subnet(int(ip), int(prefix))
+            assert _dotted(out["network"][i]) == info.network
+            assert _dotted(out["broadcast"][i]) == info.broadcast
+            assert _dotted(out["netmask"][i]) == info.netmask
+            assert _dotted(out["wildcard"][i]) == info.wildcard
+            assert _dotted(out["first_host"][i]) == info.first_host
+            assert _dotted(out["last_host"][i]) == info.last_host
+            assert out["total_hosts"][i] == info.total_hosts
+            assert out["usable_hosts"][i] == info.usable_hosts
+
+    _keys = ["network", "broadcast", "netmask", "first_host", "last_host", "total_hosts", "usable_hosts"]
+
+    def _run_kernel(self, kernel):
+        out = [np.empty_like(self.ips) for _ in range(5)] + [np.empty(self.ips.shape, dtype=np.uint64) for _ in range(2)]
+        kernel(self.ips, self.prefixes, *out)
+        return dict(zip(self._keys, out))
+
+    def test_numpy_fallback_matches_compute_subnet(self):
+        out = self._run_kernel(_kernel_np)
+        for i, (ip, prefix) in enumerate(zip(self.ips, self.prefixes)):
+            info = compute_subnet(int(ip), int(prefix))
+            for key in ("network", "broadcast", "netmask", "first_host", "last_host"):
+                assert _dotted(out[key][i]) == getattr(info, key), key
+            assert out["total_hosts"][i] == info.total_hosts
+            assert out["usable_hosts"][i] == info.usable_hosts
+
+    def test_numba_kernel_matches_numpy_fallback(self):
+        pytest.importorskip("numba")
+        kernel = _get_kernel()
+        assert kernel is not _kernel_np
+        jit_out = self._run_kernel(kernel)
+        np_out = self._run_kernel(_kernel_np)
+        for key in self._keys:
+            assert (jit_out[key] == np_out[key]).all(), key
+
+    def test_to_dotted_matches_compute_subnet(self):
+        out = compute_subnets_bulk(self.ips, self.prefixes)
+        infos = [compute_subnet(int(ip), int(p)) for ip, p in zip(self.ips, self.prefixes)]
+        assert to_dotted(self.ips) == [info.ip for info in infos]
+        assert to_dotted(out["network"]) == [info.network for info in infos]
+        assert to_dotted(out["wildcard"]) == [info.wildcard for info in infos]
+
+    @pytest.mark.parametrize("prefixes", [[33], [280], [-1], [24.9]])
+    def test_invalid_prefix_raises_error(self, prefixes):
+        with pytest.raises(ValueError):
+            compute_subnets_bulk(self.ips[:1], np.array(prefixes))
+
+    @pytest.mark.parametrize("ip_ints", [[-1], [2**32 + 5], [167772161.0]])
+    def test_invalid_ip_raises_error(self, ip_ints):
+        with pytest.raises(ValueError):
+            compute_subnets_bulk(np.array(ip_ints), np.array([24]))
+
+    @pytest.mark.parametrize("ip_ints", [[-1], [2**32 + 5], [167772161.0]])
+    def test_to_dotted_invalid_ip_raises_error(self, ip_ints):
+        with pytest.raises(ValueError):
+            to_dotted(np.array(ip_ints))
+
+    def test_to_dotted_empty(self):
+        assert to_dotted(np.array([], dtype=np.uint32)) == []
+
+    def test_length_mismatch_raises_error(self):
+        with pytest.raises(ValueError):
+            compute_subnets_bulk(self.ips, self.prefixes[:2])
+
+
+class TestEnumerateHosts:
+    @pytest.mark.parametrize("prefix", [24, 27, 30, 31, 32])
+    def test_matches_first_and_last_host(self, prefix):
+        ip = int(ipaddress.IPv4Address("192.168.200.139"))
+        info = compute_subnet(ip, prefix)
+        hosts = enumerate_hosts(ip, prefix)
+        assert hosts.dtype == np.uint32
+        assert len(hosts) == info.usable_hosts
+        assert to_dotted(hosts[[0, -1]]) == [info.first_host, info.last_host]
+
+    def test_top_of_address_space(self):
+        hosts = enumerate_hosts(0xFFFFFFFF, 30)
+        assert to_dotted(hosts) == ["255.255.255.253", "255.255.255.254"]
+
+    def test_invalid_prefix_raises_error(self):
+        with pytest.raises(ValueError):
+            enumerate_hosts(0, 33)
+
+    @pytest.mark.parametrize("network_int", [-1, 2**32, 2**33 + 6])
+    def test_invalid_ip_raises_error(self, network_int):
+        with pytest.raises(ValueError):
+            enumerate_hosts(network_int, 30)
+
+    @pytest.mark.parametrize("prefix", [0, 1, 7])
+    def test_oversized_block_raises_error(self, prefix):
+        with pytest.raises(ValueError):
+            enumerate_hosts(0, prefix)
+
+    def test_max_hosts_is_configurable(self):
+        with pytest.raises(ValueError):
+            enumerate_hosts(0, 24, max_hosts=253)
+        assert len(enumerate_hosts(0, 24, max_hosts=254)) == 254
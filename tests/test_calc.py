@@ -1,8 +1,17 @@
-import pytest
 import ipaddress
+import pickle
+import sys
+
+import pytest
+
 from subnetter.core.calculator import (
+    _MASK_STRS,
+    _WILDCARD_STRS,
+    _parse_ipv4,
+    _parse_ipv4_py,
     parse_ip_and_mask,
     compute_subnet,
+    subnet_for_hosts,
     wildcard_from_netmask,
 )
 
@@ -10,17 +19,17 @@ from subnetter.core.calculator import (
 class TestParseIpAndMask:
     def test_parse_cidr_notation(self):
         ip, prefix = parse_ip_and_mask("192.168.1.0/24")
-        assert str(ip) == "192.168.1.0"
+        assert ip == int(ipaddress.IPv4Address("192.168.1.0"))
         assert prefix == 24
 
     def test_parse_ip_and_dotted_mask(self):
         ip, prefix = parse_ip_and_mask("192.168.1.0", "255.255.255.0")
-        assert str(ip) == "192.168.1.0"
+        assert ip == int(ipaddress.IPv4Address("192.168.1.0"))
         assert prefix == 24
 
     def test_parse_ip_and_slash_mask(self):
         ip, prefix = parse_ip_and_mask("10.0.0.0", "/8")
-        assert str(ip) == "10.0.0.0"
+        assert ip == int(ipaddress.IPv4Address("10.0.0.0"))
         assert prefix == 8
 
     def test_missing_mask_raises_error(self):
@@ -35,6 +44,38 @@ class TestParseIpAndMask:
         with pytest.raises(ValueError):
             parse_ip_and_mask("2001:db8::/32")
 
+    def test_parse_cidr_with_dotted_mask(self):
+        ip, prefix = parse_ip_and_mask("172.16.5.4/255.255.0.0")
+        assert ip == int(ipaddress.IPv4Address("172.16.5.4"))
+        assert prefix == 16
+
+    def test_parse_bare_prefix_mask(self):
+        _, prefix = parse_ip_and_mask("10.0.0.0", "20")
+        assert prefix == 20
+
+    def test_parse_hostmask(self):
+        _, prefix = parse_ip_and_mask("192.168.1.0", "0.0.0.255")
+        assert prefix == 24
+
+    @pytest.mark.parametrize("mask_input", ["255.255.255.300", "/abc", "255.255.0"])
+    def test_malformed_mask_error_names_the_mask(self, mask_input):
+        with pytest.raises(ValueError, match="not a valid subnet mask"):
+            parse_ip_and_mask("192.168.1.0", mask_input)
+
+    def test_non_contiguous_mask_raises_error(self):
+        with pytest.raises(ValueError):
+            parse_ip_and_mask("192.168.1.0", "255.0.255.0")
+
+    @pytest.mark.parametrize("ip_input", ["192.168.1", "192.168.1.256", "192.168.01.1", "192.168.1.x", ""])
+    def test_invalid_ip_raises_error(self, ip_input):
+        with pytest.raises(ValueError):
+            parse_ip_and_mask(ip_input, "/24")
+
+    def test_cidr_takes_precedence_over_mask(self):
+        ip, prefix = parse_ip_and_mask("192.168.1.0/24", "255.255.0.0")
+        assert ip == int(ipaddress.IPv4Address("192.168.1.0"))
+        assert prefix == 24
+
 
 class TestWildcardFromNetmask:
     def test_wildcard_24(self):
@@ -52,6 +93,10 @@ class TestWildcardFromNetmask:
         wildcard = wildcard_from_netmask(mask)
         assert str(wildcard) == "0.0.0.0"
 
+    def test_wildcard_from_int_mask(self):
+        wildcard = wildcard_from_netmask(0xFFFFFFE0)
+        assert str(wildcard) == "0.0.0.31"
+
 
 class TestComputeSubnet:
     def test_compute_subnet_24(self):
@@ -83,4 +128,92 @@ class TestComputeSubnet:
         info = compute_subnet(ip, 32)
         assert info.total_hosts == 1
         assert info.usable_hosts == 1
-        assert info.first_host == "8.8.8.8"
\ No newline at end of file
+        assert info.first_host == "8.8.8.8"
+
+    def test_compute_subnet_masks(self):
+        ip = ipaddress.IPv4Address("192.168.200.139")
+        info = compute_subnet(ip, 27)
+        assert info.ip == "192.168.200.139"
+        assert info.network == "192.168.200.128"
+        assert info.broadcast == "192.168.200.159"
+        assert info.netmask == "255.255.255.224"
+        assert info.wildcard == "0.0.0.31"
+
+    def test_compute_subnet_0(self):
+        info = compute_subnet(ipaddress.IPv4Address("10.1.2.3"), 0)
+        assert info.network == "0.0.0.0"
+        assert info.broadcast == "255.255.255.255"
+        assert info.netmask == "0.0.0.0"
+        assert info.wildcard == "255.255.255.255"
+        assert info.total_hosts == 1 << 32
+
+    def test_compute_subnet_accepts_int(self):
+        ip, prefix = parse_ip_and_mask("192.168.1.10/24")
+        info = compute_subnet(ip, prefix)
+        assert info.ip == "192.168.1.10"
+        assert info.network == "192.168.1.0"
+
+    def test_invalid_prefix_raises_error(self):
+        with pytest.raises(ValueError):
+            compute_subnet(ipaddress.IPv4Address("10.0.0.0"), 33)
+
+    def test_compute_subnet_is_cached(self):
+        ip = ipaddress.IPv4Address("192.168.1.10")
+        assert compute_subnet(ip, 24) is compute_subnet(int(ip), 24)
+
+    def test_compute_subnet_31_and_32_host_range(self):
+        p2p = compute_subnet(ipaddress.IPv4Address("172.16.0.1"), 31)
+        assert (p2p.first_host, p2p.last_host) == ("172.16.0.0", "172.16.0.1")
+        host = compute_subnet(ipaddress.IPv4Address("8.8.8.8"), 32)
+        assert (host.network, host.last_host) == ("8.8.8.8", "8.8.8.8")
+
+
+class TestSubnetForHosts:
+    @pytest.mark.parametrize(
+        "hosts, expected",
+        [
+            (1, (32, 1, 1)),
+            (2, (31, 2, 2)),
+            (3, (29, 8, 6)),
+            (6, (29, 8, 6)),
+            (7, (28, 16, 14)),
+            (58, (26, 64, 62)),
+            (254, (24, 256, 254)),
+            (255, (23, 512, 510)),
+        ],
+    )
+    def test_smallest_fitting_block(self, hosts, expected):
+        assert subnet_for_hosts(hosts) == expected
+
+    def test_zero_hosts_raises_error(self):
+        with pytest.raises(ValueError):
+            subnet_for_hosts(0)
+
+
+class TestSubnetInfo:
+    def test_round_trips_through_pickle(self):
+        info = compute_subnet(ipaddress.IPv4Address("192.168.1.10"), 24)
+        assert pickle.loads(pickle.dumps(info)) == info
+
+    @pytest.mark.parametrize("prefix", [24, 31, 32])
+    def test_mask_strings_are_shared_per_prefix(self, prefix):
+        info = compute_subnet(ipaddress.IPv4Address("192.168.1.10"), prefix)
+        assert info.netmask is _MASK_STRS[prefix]
+        assert info.wildcard is _WILDCARD_STRS[prefix]
+        assert info.netmask is sys.intern(info.netmask)
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_has_no_instance_dict(self):
+        info = compute_subnet(ipaddress.IPv4Address("192.168.1.10"), 24)
+        assert not hasattr(info, "__dict__")
+
+
+class TestParseIpv4:
+    @pytest.mark.parametrize("s", ["0.0.0.0", "10.1.2.3", "192.168.200.139", "255.255.255.255"])
+    def test_fast_path_matches_python_parser(self, s):
+        assert _parse_ipv4(s) == _parse_ipv4_py(s) == int(ipaddress.IPv4Address(s))
+
+    @pytest.mark.parametrize("s", ["1.2.3.04", "1.2.3.256", "1.2.3", " 1.2.3.4", "1.2.3.4\x00", "+1.2.3.4"])
+    def test_invalid_raises_value_error(self, s):
+        with pytest.raises(ValueError):
+            _parse_ipv4(s)